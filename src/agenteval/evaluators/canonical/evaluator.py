@@ -124,7 +124,7 @@ class CanonicalEvaluator(BaseEvaluator):
             "system"
         ].render()
         prompt = self._prompt_template_map["generate_initial_prompt"]["prompt"].render(
-            step=self.test.steps[0]
+            step=self.test.get_step_text(0)
         )
 
         initial_prompt, reasoning = self._generate(
@@ -146,7 +146,7 @@ class CanonicalEvaluator(BaseEvaluator):
             "system"
         ].render()
         prompt = self._prompt_template_map["generate_test_status"]["prompt"].render(
-            steps=self.test.steps, conversation=self.conversation
+            steps=self.test.step_texts, conversation=self.conversation
         )
         test_status, reasoning = self._generate(
             system_prompt=system_prompt,
@@ -189,7 +189,7 @@ class CanonicalEvaluator(BaseEvaluator):
             "system"
         ].render()
         prompt = self._prompt_template_map["generate_user_response"]["prompt"].render(
-            steps=self.test.steps, conversation=self.conversation
+            steps=self.test.step_texts, conversation=self.conversation
         )
 
         user_response, reasoning = self._generate(
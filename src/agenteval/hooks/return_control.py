@@ -3,23 +3,33 @@
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import Dict, Any, Iterator, Optional
 
 from ..hook import Hook
 from ..test import Test, TestResult
 from ..trace import Trace
 from ..utils.return_control import (
+    expected_invocation_key,
+    invocation_key,
     load_response_file,
     match_invocation,
-    match_trace_invocation
+    match_trace_invocation,
+    trace_invocation_key
 )
-from ..test.return_control import ExpectedInvocation, TestStep
 
 logger = logging.getLogger(__name__)
 
 
 class ReturnControlHook(Hook):
-    """A hook that implements return control functionality for agent testing."""
+    """A hook that implements return control functionality for agent testing.
+
+    Attributes:
+        io_bound: Whether `get_response_for_invocation` performs I/O. Response
+            files are preloaded in `pre_evaluate`, so lookups are in-memory.
+    """
+
+    io_bound = False
 
     def __init__(self, test: Test, base_dir: Optional[str] = None):
         """Initialize the return control hook.
@@ -30,16 +40,22 @@ class ReturnControlHook(Hook):
         """
         self.test = test
         self.base_dir = base_dir or os.getcwd()
-        self.expected_invocations = []
         self.response_files = {}
+        self._invocations_by_key = defaultdict(list)
 
         # Extract expected invocations from test steps
-        for i, step in enumerate(test.steps):
-            if isinstance(step, TestStep) and step.expected_invocation:
-                self.expected_invocations.append({
-                    'step_index': i,
-                    'invocation': step.expected_invocation
-                })
+        self.expected_invocations = tuple(
+            {'step_index': i, 'invocation': step.expected_invocation}
+            for i, step in enumerate(test.steps)
+            if step.expected_invocation
+        )
+
+        # Index by action group and API path/function so lookups only
+        # need to match against invocations that can possibly match
+        for expected in self.expected_invocations:
+            invocation = expected['invocation']
+            if key := expected_invocation_key(invocation):
+                self._invocations_by_key[key].append(invocation)
 
     def pre_evaluate(self, test: Test, trace: Trace) -> None:
         """Pre-evaluation setup for return control."""
@@ -48,9 +64,12 @@ class ReturnControlHook(Hook):
 
         logger.info(f"Return control enabled for test '{test.name}' with {len(self.expected_invocations)} expected invocations")
 
-        # Pre-load response files
+        # Pre-load response files, reading each unique file only once
         for expected in self.expected_invocations:
             invocation = expected['invocation']
+            if invocation.invocation_response_file in self.response_files:
+                continue
+
             try:
                 response_content = load_response_file(
                     invocation.invocation_response_file,
@@ -67,49 +86,40 @@ class ReturnControlHook(Hook):
         if not self.expected_invocations:
             return
 
-        trace_data = trace.steps
-        return_control_invocations = []
-
-        for step_data in trace_data:
-            target_response_data = step_data.get('data')
-            if not target_response_data:
-                continue
-
-            # Extract return control invocations from trace data
-            for trace_event in target_response_data.get('bedrock_agent_trace', []):
-                invocation_input = trace_event.get('orchestrationTrace', {}).get('invocationInput', {})
-                if (invocation := invocation_input.get('actionGroupInvocationInput')) and invocation.get('executionType') == 'RETURN_CONTROL':
-                    return_control_invocations.append(invocation)
-
-        # Validate invocations
-        validation_errors = []
-        matched_invocations = set()
-
+        # Group the expected invocations by lookup key so each actual invocation
+        # is only matched against expected invocations that can possibly match
+        remaining_expected = defaultdict(list)
         for expected in self.expected_invocations:
-            invocation = expected['invocation']
-            step_index = expected['step_index']
+            remaining_expected[expected_invocation_key(expected['invocation'])].append(expected)
+        num_remaining = len(self.expected_invocations)
 
-            # Find matching actual invocation
+        # Match actual invocations as they are extracted from the trace
+        unexpected_invocations = []
+        for actual_invocation in self._iter_return_control_invocations(trace):
             matched = False
-            for actual_invocation in return_control_invocations:
-                if match_trace_invocation(invocation, actual_invocation):
-                    matched = True
-                    matched_invocations.add(id(actual_invocation))
-                    logger.debug(f"Matched expected invocation for step {step_index}")
-                    break
+            if num_remaining:
+                candidates = remaining_expected.get(trace_invocation_key(actual_invocation), [])
+                for position, expected in enumerate(candidates):
+                    if match_trace_invocation(expected['invocation'], actual_invocation):
+                        matched = True
+                        num_remaining -= 1
+                        del candidates[position]
+                        logger.debug(f"Matched expected invocation for step {expected['step_index']}")
+                        break
 
             if not matched:
-                validation_errors.append(
-                    f"Step {step_index}: Expected invocation not found. "
-                    f"Expected: {invocation.dict()}"
-                )
-
-        # Check for unexpected invocations
-        unexpected_invocations = []
-        for actual_invocation in return_control_invocations:
-            if id(actual_invocation) not in matched_invocations:
                 unexpected_invocations.append(actual_invocation)
 
+        # Validate invocations
+        validation_errors = [
+            f"Step {expected['step_index']}: Expected invocation not found. "
+            f"Expected: {expected['invocation'].model_dump()}"
+            for expected in sorted(
+                (expected for candidates in remaining_expected.values() for expected in candidates),
+                key=lambda expected: expected['step_index']
+            )
+        ]
+
         if unexpected_invocations:
             validation_errors.append(
                 f"Found {len(unexpected_invocations)} unexpected invocations: {unexpected_invocations}"
@@ -120,10 +130,27 @@ class ReturnControlHook(Hook):
             test_result.passed = False
             test_result.result = "RETURN_CONTROL_VALIDATION_FAILED"
             test_result.reasoning = "\n".join(validation_errors)
-            logger.error(f"Return control validation failed for test '{test.name}': {validation_errors}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Return control validation failed for test '{test.name}': {validation_errors}")
         else:
             logger.info(f"Return control validation passed for test '{test.name}'")
 
+    @staticmethod
+    def _iter_return_control_invocations(trace: Trace) -> Iterator[Dict[str, Any]]:
+        """Yield the return control invocations recorded in the trace, in order."""
+        for step_data in trace.steps:
+            target_response_data = step_data.get('data')
+            if not target_response_data:
+                continue
+
+            for trace_event in target_response_data.get('bedrock_agent_trace', ()):
+                if not (orchestration_trace := trace_event.get('orchestrationTrace')):
+                    continue
+                if not (invocation_input := orchestration_trace.get('invocationInput')):
+                    continue
+                if (invocation := invocation_input.get('actionGroupInvocationInput')) and invocation.get('executionType') == 'RETURN_CONTROL':
+                    yield invocation
+
     def get_response_for_invocation(self, invocation_data: Dict[str, Any]) -> Optional[Any]:
         """Get the response for a specific invocation.
 
@@ -133,9 +160,9 @@ class ReturnControlHook(Hook):
         Returns:
             The response content if a match is found, None otherwise
         """
+        candidates = self._invocations_by_key.get(invocation_key(invocation_data), ())
 
-        for expected in self.expected_invocations:
-            invocation = expected['invocation']
+        for invocation in candidates:
             if match_invocation(invocation, invocation_data):
                 return self.response_files.get(invocation.invocation_response_file)
 
@@ -204,10 +204,7 @@ class Plan(BaseModel):
         target_kwargs = {}
 
         # Check if any step has expected_invocation
-        has_return_control = any(
-            hasattr(step, 'expected_invocation') and step.expected_invocation
-            for step in test.steps
-        )
+        has_return_control = any(step.expected_invocation for step in test.steps)
 
         if has_return_control:
             # Create return control hook
@@ -1,6 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
 import logging
 import uuid
 from typing import Optional
@@ -8,9 +9,56 @@ from typing import Optional
 from agenteval.targets import Boto3Target, TargetResponse
 
 _SERVICE_NAME = "bedrock-agent-runtime"
+_MAX_RETURN_CONTROL_WORKERS = 8
 logger = logging.getLogger(__name__)
 
 
+class _StreamState:
+    """Accumulates the events of an `InvokeAgent` response stream."""
+
+    __slots__ = ("completion", "citations", "trace_data", "return_control")
+
+    def __init__(self):
+        self.completion = bytearray()
+        self.citations = []
+        self.trace_data = []
+        self.return_control = None
+
+    def to_target_response(self) -> TargetResponse:
+        """Build the `TargetResponse` for the events accumulated so far."""
+        data = {
+            "bedrock_agent_trace": self.trace_data,
+        }
+        if self.citations:
+            data["bedrock_agent_citations"] = self.citations
+
+        return TargetResponse(
+            response=self.completion.decode("utf-8"),
+            data=data
+        )
+
+
+def _on_chunk(chunk: dict, state: _StreamState) -> None:
+    state.completion.extend(chunk["bytes"])
+    if chunk.get("citations"):
+        state.citations.append(chunk["citations"])
+
+
+def _on_trace(trace: dict, state: _StreamState) -> None:
+    state.trace_data.append(trace["trace"])
+
+
+def _on_return_control(return_control: dict, state: _StreamState) -> None:
+    state.return_control = return_control
+
+
+_EVENT_HANDLERS = {
+    "chunk": _on_chunk,
+    "trace": _on_trace,
+    "returnControl": _on_return_control,
+}
+
+
 class BedrockAgentTarget(Boto3Target):
     """A target encapsulating an Amazon Bedrock agent."""
 
@@ -18,8 +66,8 @@ class BedrockAgentTarget(Boto3Target):
         self,
         bedrock_agent_id: str,
         bedrock_agent_alias_id: str,
-        bedrock_session_attributes: Optional[dict] = {},
-        bedrock_prompt_session_attributes: Optional[dict] = {},
+        bedrock_session_attributes: Optional[dict] = None,
+        bedrock_prompt_session_attributes: Optional[dict] = None,
         return_control_hook=None,
         **kwargs
     ):
@@ -42,12 +90,15 @@ class BedrockAgentTarget(Boto3Target):
             self._session_state["promptSessionAttributes"] = (
                 bedrock_prompt_session_attributes
             )
-        self._session_id: str = str(uuid.uuid4())
+        self._session_id: Optional[str] = None
         self._return_control_hook = return_control_hook
-        self._trace_data = []
-        self._citations = []
 
     def invoke(self, prompt: str) -> TargetResponse:
+        # Create the session on first use, so targets that are never invoked
+        # don't generate one
+        if self._session_id is None:
+            self._session_id = str(uuid.uuid4())
+
         response = self.boto3_client.invoke_agent(
             enableTrace=True,
             agentId=self._bedrock_agent_id,
@@ -63,39 +114,34 @@ class BedrockAgentTarget(Boto3Target):
             logger.error(f"Error handling Bedrock Agent response: {e}")
             raise e
 
-    def handle_response(self, response: dict) -> TargetResponse:
+    def handle_response(
+        self, response: dict, state: Optional[_StreamState] = None
+    ) -> TargetResponse:
         stream = response["completion"]
-        completion = ""
+        if state is None:
+            state = _StreamState()
 
         for event in stream:
-            logger.debug(f"Event: {list(event.keys())}")
-
-            if chunk := event.get("chunk"):
-                completion += chunk["bytes"].decode()
-                if chunk.get("citations"):
-                    self._citations.append(chunk["citations"])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Event: {list(event.keys())}")
 
-            elif trace := event.get("trace"):
-                self._trace_data.append(trace["trace"])
+            for key, payload in event.items():
+                if handler := _EVENT_HANDLERS.get(key):
+                    handler(payload, state)
 
-            elif return_control := event.get("returnControl"):
-                logger.debug(f"Return control event received: {return_control}")
-                return self.handle_return_control(return_control)
+            if return_control := state.return_control:
+                logger.debug("Return control event received: %s", return_control)
+                state.return_control = None
+                return self.handle_return_control(return_control, state)
 
-        data = {
-            "bedrock_agent_trace": self._trace_data,
-        }
-        if self._citations:
-            data["bedrock_agent_citations"] = self._citations
+        target_response = state.to_target_response()
+        logger.debug("Invoke Agent Completed: %s", target_response.response)
 
-        logger.debug(f"Invoke Agent Completed: {completion}")
-
-        return TargetResponse(
-            response=completion,
-            data=data
-        )
+        return target_response
 
-    def handle_return_control(self, return_control: dict) -> TargetResponse:
+    def handle_return_control(
+        self, return_control: dict, state: Optional[_StreamState] = None
+    ) -> TargetResponse:
         if not self._return_control_hook:
             # No return control hook, continue normally
             logger.warning("Return control event received but no hook configured")
@@ -106,17 +152,16 @@ class BedrockAgentTarget(Boto3Target):
 
         invocation_id = return_control["invocationId"]
         invocation_inputs = return_control["invocationInputs"]
-        logger.debug(f"Processing return control with {len(invocation_inputs)} invocation inputs")
+        logger.debug("Processing return control with %d invocation inputs", len(invocation_inputs))
 
         invocation_results = []
-        for invocation_input in invocation_inputs:
-            mock_response = self._return_control_hook.get_response_for_invocation(invocation_input)
-
+        mock_responses = self._get_mock_responses(invocation_inputs)
+        for invocation_input, mock_response in zip(invocation_inputs, mock_responses):
             if mock_response is None:
                 logger.warning(f"No mock response found for invocation: {invocation_input}")
                 continue
 
-            logger.debug(f"Found mock response for invocation: {invocation_input}")
+            logger.debug("Found mock response for invocation: %s", invocation_input)
 
             invocation_result = {}
             if invocation_input.get("apiInvocationInput"):
@@ -161,9 +206,30 @@ class BedrockAgentTarget(Boto3Target):
             agentAliasId=self._bedrock_agent_alias_id,
             sessionId=self._session_id,
             sessionState={
+                **self._session_state,
                 "invocationId": invocation_id,
                 "returnControlInvocationResults": invocation_results
             }
         )
 
-        return self.handle_response(response)
+        # Continue accumulating into the same state, so the response includes
+        # the trace events that led to the return control
+        return self.handle_response(response, state)
+
+    def _get_mock_responses(self, invocation_inputs: list) -> list:
+        """Look up the mock response for each invocation input, in order.
+
+        Lookups run concurrently only when the hook declares them as I/O bound;
+        otherwise a thread pool costs more than the lookups themselves.
+        """
+        get_response = self._return_control_hook.get_response_for_invocation
+
+        if len(invocation_inputs) > 1 and getattr(
+            self._return_control_hook, "io_bound", False
+        ):
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(_MAX_RETURN_CONTROL_WORKERS, len(invocation_inputs))
+            ) as executor:
+                return list(executor.map(get_response, invocation_inputs))
+
+        return [get_response(invocation_input) for invocation_input in invocation_inputs]
@@ -1,11 +1,12 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Optional, Union
+from functools import cached_property
+from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
 
-class InvocationParameter(BaseModel):
+class InvocationParameter(BaseModel, frozen=True, extra="forbid"):
     """A parameter for an API or function invocation."""
 
     name: str
@@ -13,7 +14,7 @@ class InvocationParameter(BaseModel):
     value: Union[str, int, float, bool]
 
 
-class ApiInvocationInput(BaseModel):
+class ApiInvocationInput(BaseModel, frozen=True, extra="forbid"):
     """Expected API invocation input."""
 
     actionGroup: str
@@ -21,16 +22,26 @@ class ApiInvocationInput(BaseModel):
     httpMethod: str
     parameters: List[InvocationParameter] = Field(default_factory=list)
 
+    @cached_property
+    def _params_by_name(self) -> Dict[str, Union[str, int, float, bool]]:
+        """Expected parameter values keyed by parameter name."""
+        return {p.name: p.value for p in self.parameters}
 
-class FunctionInvocationInput(BaseModel):
+
+class FunctionInvocationInput(BaseModel, frozen=True, extra="forbid"):
     """Expected function invocation input."""
 
     actionGroup: str
     function: str
     parameters: List[InvocationParameter] = Field(default_factory=list)
 
+    @cached_property
+    def _params_by_name(self) -> Dict[str, Union[str, int, float, bool]]:
+        """Expected parameter values keyed by parameter name."""
+        return {p.name: p.value for p in self.parameters}
+
 
-class ExpectedInvocation(BaseModel):
+class ExpectedInvocation(BaseModel, frozen=True, extra="forbid"):
     """Expected invocation configuration for return control."""
 
     apiInvocationInput: Optional[ApiInvocationInput] = None
@@ -38,7 +49,7 @@ class ExpectedInvocation(BaseModel):
     invocation_response_file: str
 
 
-class TestStep(BaseModel):
+class TestStep(BaseModel, frozen=True, extra="forbid"):
     """A test step with optional return control configuration."""
 
     # do not collect as a pytest
@@ -1,19 +1,19 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Optional, Union, List
+from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, field_validator
 
-from .return_control import TestStep, ReturnControlConfig
+from .return_control import ExpectedInvocation, TestStep, ReturnControlConfig
 
 
-class Test(BaseModel, validate_assignment=True):
+class Test(BaseModel):
     """A test case.
 
     Attributes:
         name: Name of the test.
-        steps: List of step to perform for the test. Can be strings or TestStep objects.
+        steps: List of steps to perform for the test. Plain strings are converted to TestStep objects.
         expected_results: List of expected results for the test.
         initial_prompt: The initial prompt.
         max_turns: Maximum number of turns allowed for the test.
@@ -25,23 +25,31 @@ class Test(BaseModel, validate_assignment=True):
     __test__ = False
 
     name: str
-    steps: List[Union[str, TestStep]]
+    steps: list[TestStep]
     expected_results: list[str]
     initial_prompt: Optional[str] = None
     max_turns: int
     hook: Optional[str] = None
     return_control: Optional[ReturnControlConfig] = None
 
+    @field_validator("steps", mode="before")
+    @classmethod
+    def _convert_string_steps(cls, steps):
+        if not isinstance(steps, list):
+            return steps
+        return [
+            TestStep(step=step) if isinstance(step, str) else step for step in steps
+        ]
+
+    @property
+    def step_texts(self) -> list[str]:
+        """The text of each step."""
+        return [step.step for step in self.steps]
+
     def get_step_text(self, step_index: int) -> str:
-        """Get the step text, handling both string and TestStep formats."""
-        step = self.steps[step_index]
-        if isinstance(step, str):
-            return step
-        return step.step
+        """Get the text of a step."""
+        return self.steps[step_index].step
 
-    def get_expected_invocation(self, step_index: int):
+    def get_expected_invocation(self, step_index: int) -> Optional[ExpectedInvocation]:
         """Get the expected invocation for a step, if any."""
-        step = self.steps[step_index]
-        if isinstance(step, TestStep):
-            return step.expected_invocation
-        return None
+        return self.steps[step_index].expected_invocation
@@ -5,11 +5,11 @@ from __future__ import annotations
 
 from typing import Optional, Union, List
 
-from pydantic import BaseModel, computed_field, model_validator
+from pydantic import BaseModel, model_validator
 
 from agenteval import defaults
 from agenteval.test import Test
-from agenteval.test.return_control import TestStep, ExpectedInvocation, ApiInvocationInput, FunctionInvocationInput, InvocationParameter
+from agenteval.test.return_control import TestStep, ExpectedInvocation
 
 
 class TestSuite(BaseModel):
@@ -26,17 +26,21 @@ class TestSuite(BaseModel):
 
     @model_validator(mode="after")
     def _check_test_names_unique(self) -> TestSuite:
-        unique_names = len(set(test.name for test in self.tests))
+        seen = set()
 
-        if unique_names != len(self.tests):
-            raise ValueError("Test names must be unique")
+        for test in self.tests:
+            if test.name in seen:
+                raise ValueError(f"Test names must be unique, found duplicate: {test.name}")
+            seen.add(test.name)
 
         return self
 
     def __iter__(self):
         return iter(self.tests)
 
-    @computed_field
+    def __len__(self) -> int:
+        return len(self.tests)
+
     @property
     def num_tests(self) -> int:
         """Returns the number of tests in the test suite."""
@@ -61,7 +65,13 @@ class TestSuite(BaseModel):
         tests = []
 
         if filter:
-            names = TestSuite._parse_filter(filter)
+            requested_names = TestSuite._parse_filter(filter)
+            unknown_names = requested_names - config.keys()
+            if unknown_names:
+                raise KeyError(f"Unknown tests in filter: {', '.join(sorted(unknown_names))}")
+
+            # Preserve the order the tests are defined in the config
+            names = [name for name in config if name in requested_names]
         else:
             names = config.keys()
 
@@ -83,60 +93,31 @@ class TestSuite(BaseModel):
         return tests
 
     @staticmethod
-    def _parse_steps(steps_config: List[Union[str, dict]]) -> List[Union[str, TestStep]]:
-        """Parse steps configuration into TestStep objects or strings."""
+    def _parse_steps(steps_config: List[Union[str, dict]]) -> List[TestStep]:
+        """Parse steps configuration into TestStep objects."""
         parsed_steps = []
 
         for step_config in steps_config:
             if isinstance(step_config, str):
                 # Simple string step
-                parsed_steps.append(step_config)
+                parsed_steps.append(
+                    TestStep.model_construct(step=step_config, expected_invocation=None)
+                )
             elif isinstance(step_config, dict):
                 # Complex step with return control configuration
                 step_text = step_config.get("step")
                 if not step_text:
                     raise ValueError("Step configuration must contain 'step' field")
+                if not isinstance(step_text, str):
+                    raise ValueError(f"Step must be a string: {step_text}")
 
+                # Validate the nested invocation config in a single pass
                 expected_invocation = None
-                if "expected_invocation" in step_config:
-                    inv_config = step_config["expected_invocation"]
-
-                    # Parse API invocation input
-                    api_invocation = None
-                    if "apiInvocationInput" in inv_config:
-                        api_config = inv_config["apiInvocationInput"]
-                        parameters = [
-                            InvocationParameter(**param)
-                            for param in api_config.get("parameters", [])
-                        ]
-                        api_invocation = ApiInvocationInput(
-                            actionGroup=api_config["actionGroup"],
-                            apiPath=api_config["apiPath"],
-                            httpMethod=api_config["httpMethod"],
-                            parameters=parameters
-                        )
-
-                    # Parse function invocation input
-                    function_invocation = None
-                    if "functionInvocationInput" in inv_config:
-                        func_config = inv_config["functionInvocationInput"]
-                        parameters = [
-                            InvocationParameter(**param)
-                            for param in func_config.get("parameters", [])
-                        ]
-                        function_invocation = FunctionInvocationInput(
-                            actionGroup=func_config["actionGroup"],
-                            function=func_config["function"],
-                            parameters=parameters
-                        )
-
-                    expected_invocation = ExpectedInvocation(
-                        apiInvocationInput=api_invocation,
-                        functionInvocationInput=function_invocation,
-                        invocation_response_file=inv_config["invocation_response_file"]
-                    )
-
-                test_step = TestStep(
+                if (inv_config := step_config.get("expected_invocation")) is not None:
+                    expected_invocation = ExpectedInvocation.model_validate(inv_config)
+
+                # Both fields have been checked above, so skip re-validation
+                test_step = TestStep.model_construct(
                     step=step_text,
                     expected_invocation=expected_invocation
                 )
@@ -147,5 +128,5 @@ class TestSuite(BaseModel):
         return parsed_steps
 
     @staticmethod
-    def _parse_filter(filter: str) -> list[str]:
-        return [n.strip() for n in filter.split(",")]
+    def _parse_filter(filter: str) -> frozenset[str]:
+        return frozenset(n.strip() for n in filter.split(","))
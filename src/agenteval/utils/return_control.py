@@ -1,10 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import json
+import functools
 import os
-from typing import Any, Dict, Optional, Union
-from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 from ..test.return_control import (
     ExpectedInvocation,
@@ -13,12 +12,15 @@ from ..test.return_control import (
 )
 
 
-def load_response_file(
-    file_path: str, base_dir: Optional[str] = None
-) -> Union[Dict[str, Any], str]:
+def load_response_file(file_path: str, base_dir: Optional[str] = None) -> str:
     """
     Load a response file and return its contents.
 
+    Contents are cached by path and modification time, so repeated loads of an
+    unchanged file do not read it from disk again. The content is returned
+    verbatim, whatever the file format, since it is passed to the agent as the
+    text body of the invocation result.
+
     Args:
         file_path: Path to the response file
         base_dir: Base directory to resolve relative paths
@@ -28,50 +30,123 @@ def load_response_file(
 
     Raises:
         FileNotFoundError: If the response file doesn't exist
-        ValueError: If the file format is not supported
     """
     if base_dir:
         full_path = os.path.join(base_dir, file_path)
     else:
         full_path = file_path
 
-    if not os.path.exists(full_path):
+    # A single handler covers the file disappearing between the stat and the read
+    try:
+        return _read_response_file(full_path, os.stat(full_path).st_mtime_ns)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Response file not found: {full_path}")
 
+
+@functools.lru_cache(maxsize=256)
+def _read_response_file(full_path: str, mtime_ns: int) -> str:
+    # The modification time is part of the cache key, so an edited file is re-read
     with open(full_path, "r", encoding="utf-8") as f:
-        content = f.read()
+        return f.read()
+
+
+load_response_file.cache_clear = _read_response_file.cache_clear
+
+
+InvocationKey = Tuple[str, Optional[str], Optional[str]]
+
+
+def expected_invocation_key(expected: ExpectedInvocation) -> Optional[InvocationKey]:
+    """Return the `(actionGroup, apiPath, function)` lookup key for an expected invocation."""
+    if expected.apiInvocationInput:
+        api = expected.apiInvocationInput
+        return (api.actionGroup, api.apiPath, None)
+    elif expected.functionInvocationInput:
+        function = expected.functionInvocationInput
+        return (function.actionGroup, None, function.function)
+
+    return None
+
+
+def invocation_key(actual: Dict[str, Any]) -> Optional[InvocationKey]:
+    """Return the lookup key for a return control invocation input."""
+    if api := actual.get("apiInvocationInput"):
+        return (api.get("actionGroup"), api.get("apiPath"), None)
+    elif function := actual.get("functionInvocationInput"):
+        return (function.get("actionGroup"), None, function.get("function"))
+
+    return None
 
-    return content
+
+def trace_invocation_key(trace: Dict[str, Any]) -> InvocationKey:
+    """Return the lookup key for an action group invocation found in a trace."""
+    return (trace.get("actionGroupName"), trace.get("apiPath"), trace.get("function"))
+
+
+_MISSING = object()
 
 
 def _match_parameters(expected_params: Dict[str, Any], actual_params: list) -> bool:
-    actual_param_dict = {p.get("name"): p.get("value") for p in actual_params}
-    return actual_param_dict == expected_params
+    if len(actual_params) != len(expected_params):
+        return False
 
+    for param in actual_params:
+        if expected_params.get(param["name"], _MISSING) != param["value"]:
+            return False
 
-def match_api_invocation(expected: ApiInvocationInput, actual: Dict[str, Any]) -> bool:
+    # Every actual parameter matched; make sure none was repeated in place of
+    # another expected parameter
+    return len({param["name"] for param in actual_params}) == len(expected_params)
+
+
+def _match_api_fields(
+    expected: ApiInvocationInput,
+    action_group: Optional[str],
+    api_path: Optional[str],
+    http_method: Optional[str],
+    parameters: list,
+) -> bool:
     if (
-        actual.get("actionGroup") != expected.actionGroup
-        or actual.get("apiPath") != expected.apiPath
-        or actual.get("httpMethod") != expected.httpMethod
+        action_group != expected.actionGroup
+        or api_path != expected.apiPath
+        or http_method != expected.httpMethod
     ):
         return False
 
-    expected_params = {p.name: p.value for p in expected.parameters}
-    return _match_parameters(expected_params, actual.get("parameters", []))
+    return _match_parameters(expected._params_by_name, parameters)
 
 
-def match_function_invocation(
-    expected: FunctionInvocationInput, actual: Dict[str, Any]
+def _match_function_fields(
+    expected: FunctionInvocationInput,
+    action_group: Optional[str],
+    function: Optional[str],
+    parameters: list,
 ) -> bool:
-    if (
-        actual.get("actionGroup") != expected.actionGroup
-        or actual.get("function") != expected.function
-    ):
+    if action_group != expected.actionGroup or function != expected.function:
         return False
 
-    expected_params = {p.name: p.value for p in expected.parameters}
-    return _match_parameters(expected_params, actual.get("parameters", []))
+    return _match_parameters(expected._params_by_name, parameters)
+
+
+def match_api_invocation(expected: ApiInvocationInput, actual: Dict[str, Any]) -> bool:
+    return _match_api_fields(
+        expected,
+        actual.get("actionGroup"),
+        actual.get("apiPath"),
+        actual.get("httpMethod"),
+        actual.get("parameters", []),
+    )
+
+
+def match_function_invocation(
+    expected: FunctionInvocationInput, actual: Dict[str, Any]
+) -> bool:
+    return _match_function_fields(
+        expected,
+        actual.get("actionGroup"),
+        actual.get("function"),
+        actual.get("parameters", []),
+    )
 
 
 def match_invocation(expected: ExpectedInvocation, actual: Dict[str, Any]) -> bool:
@@ -88,22 +163,22 @@ def match_invocation(expected: ExpectedInvocation, actual: Dict[str, Any]) -> bo
 
 
 def match_trace_invocation(expected: ExpectedInvocation, trace: Dict[str, Any]) -> bool:
+    # Trace invocations use different field names, so pass the fields straight
+    # to the matchers rather than building an invocation input dict
     if expected.apiInvocationInput:
-        actual_api_invocation = {
-            "actionGroup": trace.get("actionGroupName"),
-            "apiPath": trace.get("apiPath"),
-            "httpMethod": trace.get("verb"),
-            "parameters": trace.get("parameters", []),
-        }
-        return match_api_invocation(expected.apiInvocationInput, actual_api_invocation)
+        return _match_api_fields(
+            expected.apiInvocationInput,
+            trace.get("actionGroupName"),
+            trace.get("apiPath"),
+            trace.get("verb"),
+            trace.get("parameters", []),
+        )
     elif expected.functionInvocationInput:
-        actual_function_invocation = {
-            "actionGroup": trace.get("actionGroupName"),
-            "function": trace.get("function"),
-            "parameters": trace.get("parameters", []),
-        }
-        return match_function_invocation(
-            expected.functionInvocationInput, actual_function_invocation
+        return _match_function_fields(
+            expected.functionInvocationInput,
+            trace.get("actionGroupName"),
+            trace.get("function"),
+            trace.get("parameters", []),
         )
 
     return False
@@ -0,0 +1,158 @@
+import pytest
+
+from agenteval.hooks import return_control
+from agenteval.test import TestSuite
+
+
+def _api_step(step, response_file, location="Ottawa"):
+    return {
+        "step": step,
+        "expected_invocation": {
+            "apiInvocationInput": {
+                "actionGroup": "WeatherAPIs",
+                "apiPath": "/get-weather",
+                "httpMethod": "GET",
+                "parameters": [
+                    {"name": "location", "type": "string", "value": location}
+                ],
+            },
+            "invocation_response_file": response_file,
+        },
+    }
+
+
+def _trace_step(*invocations):
+    return {
+        "data": {
+            "bedrock_agent_trace": [
+                {
+                    "orchestrationTrace": {
+                        "invocationInput": {
+                            "actionGroupInvocationInput": {
+                                "actionGroupName": "WeatherAPIs",
+                                "apiPath": "/get-weather",
+                                "verb": "GET",
+                                "parameters": [
+                                    {"name": "location", "value": location}
+                                ],
+                                "executionType": "RETURN_CONTROL",
+                            }
+                        }
+                    }
+                }
+                for location in invocations
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def test_result_fixture(mocker):
+    return mocker.MagicMock(passed=True)
+
+
+@pytest.fixture
+def test_fixture():
+    config = {
+        "test_1": {
+            "steps": [
+                _api_step("step 1", "weather.json"),
+                "step 2",
+                _api_step("step 3", "weather.json", location="Toronto"),
+            ],
+            "expected_results": ["result 1"],
+        }
+    }
+    return TestSuite.load(config, None).tests[0]
+
+
+class TestReturnControlHook:
+    def test_init(self, test_fixture):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+
+        assert [e["step_index"] for e in hook.expected_invocations] == [0, 2]
+
+    def test_pre_evaluate_loads_each_file_once(self, mocker, test_fixture):
+        mock_load = mocker.patch.object(return_control, "load_response_file")
+        mock_load.return_value = "response"
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+
+        hook.pre_evaluate(test_fixture, mocker.MagicMock())
+
+        mock_load.assert_called_once_with("weather.json", "base")
+        assert hook.response_files == {"weather.json": "response"}
+
+    def test_get_response_for_invocation(self, test_fixture):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+        hook.response_files = {"weather.json": "response"}
+
+        api_input = {
+            "actionGroup": "WeatherAPIs",
+            "apiPath": "/get-weather",
+            "httpMethod": "GET",
+            "parameters": [{"name": "location", "value": "Toronto"}],
+        }
+
+        assert (
+            hook.get_response_for_invocation({"apiInvocationInput": api_input})
+            == "response"
+        )
+
+        api_input["parameters"] = [{"name": "location", "value": "Seattle"}]
+        assert hook.get_response_for_invocation({"apiInvocationInput": api_input}) is None
+
+    def test_get_response_for_invocation_unknown_key(self, test_fixture):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+        hook.response_files = {"weather.json": "response"}
+
+        function_input = {
+            "actionGroup": "WeatherAPIs",
+            "function": "get_weather",
+            "parameters": [{"name": "location", "value": "Ottawa"}],
+        }
+
+        assert (
+            hook.get_response_for_invocation(
+                {"functionInvocationInput": function_input}
+            )
+            is None
+        )
+
+    def test_post_evaluate(self, mocker, test_fixture, test_result_fixture):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+        trace = mocker.MagicMock(steps=[_trace_step("Ottawa"), _trace_step("Toronto")])
+
+        hook.post_evaluate(test_fixture, test_result_fixture, trace)
+
+        assert test_result_fixture.passed is True
+
+    def test_post_evaluate_validation_failed(
+        self, mocker, test_fixture, test_result_fixture
+    ):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+        trace = mocker.MagicMock(
+            steps=[{"data": None}, _trace_step("Seattle", "Ottawa", "Ottawa")]
+        )
+
+        hook.post_evaluate(test_fixture, test_result_fixture, trace)
+
+        assert test_result_fixture.passed is False
+        assert test_result_fixture.result == "RETURN_CONTROL_VALIDATION_FAILED"
+        errors = test_result_fixture.reasoning.split("\n")
+        assert len(errors) == 2
+        assert errors[0].startswith("Step 2: Expected invocation not found.")
+        assert errors[1].startswith("Found 2 unexpected invocations:")
+        assert errors[1].index("Seattle") < errors[1].index("Ottawa")
+
+    def test_post_evaluate_unexpected_after_all_matched(
+        self, mocker, test_fixture, test_result_fixture
+    ):
+        hook = return_control.ReturnControlHook(test_fixture, base_dir="base")
+        trace = mocker.MagicMock(steps=[_trace_step("Toronto", "Ottawa", "Toronto")])
+
+        hook.post_evaluate(test_fixture, test_result_fixture, trace)
+
+        assert test_result_fixture.passed is False
+        assert test_result_fixture.reasoning.startswith(
+            "Found 1 unexpected invocations:"
+        )
@@ -23,7 +23,20 @@ def bedrock_agent_fixture(mocker):
 
 
 class TestBedrockAgentTarget:
-    def test_session_id(self, bedrock_agent_fixture):
+    def test_session_id(self, mocker, bedrock_agent_fixture):
+        mock_invoke_agent = mocker.patch.object(
+            bedrock_agent_fixture.boto3_client, "invoke_agent"
+        )
+        mock_invoke_agent.return_value = {"completion": []}
+
+        assert bedrock_agent_fixture._session_id is None
+
+        bedrock_agent_fixture.invoke("test prompt")
+        session_id = bedrock_agent_fixture._session_id
+        bedrock_agent_fixture.invoke("test prompt")
+
+        assert bedrock_agent_fixture._session_id == session_id
+        assert mock_invoke_agent.call_args.kwargs["sessionId"] == session_id
         try:
             uuid.UUID(bedrock_agent_fixture._session_id)
             assert True
@@ -47,3 +60,140 @@ class TestBedrockAgentTarget:
 
         assert response.response == "test completion"
         assert response.data == {"bedrock_agent_trace": [{"preProcessingTrace": None}]}
+
+    def test_invoke_does_not_accumulate_across_calls(
+        self, mocker, bedrock_agent_fixture
+    ):
+        mock_invoke_agent = mocker.patch.object(
+            bedrock_agent_fixture.boto3_client, "invoke_agent"
+        )
+
+        mock_invoke_agent.side_effect = lambda **kwargs: {
+            "completion": [
+                {"chunk": {"bytes": b"test", "citations": [{"text": "source"}]}},
+                {"trace": {"trace": {"preProcessingTrace": None}}},
+            ]
+        }
+
+        bedrock_agent_fixture.invoke("test prompt")
+        response = bedrock_agent_fixture.invoke("test prompt")
+
+        assert response.data == {
+            "bedrock_agent_trace": [{"preProcessingTrace": None}],
+            "bedrock_agent_citations": [[{"text": "source"}]],
+        }
+
+    def test_invoke_with_citations(self, mocker, bedrock_agent_fixture):
+        mock_invoke_agent = mocker.patch.object(
+            bedrock_agent_fixture.boto3_client, "invoke_agent"
+        )
+
+        mock_invoke_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": b"test", "citations": [{"text": "source"}]}},
+                {"unknown": {}},
+            ]
+        }
+
+        response = bedrock_agent_fixture.invoke("test prompt")
+
+        assert response.response == "test"
+        assert response.data == {
+            "bedrock_agent_trace": [],
+            "bedrock_agent_citations": [[{"text": "source"}]],
+        }
+
+    def test_invoke_multibyte_split_across_chunks(self, mocker, bedrock_agent_fixture):
+        mock_invoke_agent = mocker.patch.object(
+            bedrock_agent_fixture.boto3_client, "invoke_agent"
+        )
+
+        encoded = "22°C".encode("utf-8")
+        mock_invoke_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": encoded[:3]}},
+                {"chunk": {"bytes": encoded[3:]}},
+            ]
+        }
+
+        response = bedrock_agent_fixture.invoke("test prompt")
+
+        assert response.response == "22°C"
+
+    def test_invoke_return_control(self, mocker, bedrock_agent_fixture):
+        mock_hook = mocker.MagicMock()
+        mock_hook.get_response_for_invocation.return_value = "mock response"
+        bedrock_agent_fixture._return_control_hook = mock_hook
+
+        mock_invoke_agent = mocker.patch.object(
+            bedrock_agent_fixture.boto3_client, "invoke_agent"
+        )
+
+        function_input = {
+            "actionGroup": "WeatherAPIs",
+            "function": "get_weather",
+            "parameters": [],
+        }
+        mock_invoke_agent.side_effect = [
+            {
+                "completion": [
+                    {"trace": {"trace": {"orchestrationTrace": "before"}}},
+                    {
+                        "returnControl": {
+                            "invocationId": "test-invocation-id",
+                            "invocationInputs": [
+                                {"functionInvocationInput": function_input}
+                            ],
+                        }
+                    }
+                ]
+            },
+            {
+                "completion": [
+                    {"trace": {"trace": {"orchestrationTrace": "after"}}},
+                    {"chunk": {"bytes": b"test completion"}},
+                ]
+            },
+        ]
+
+        response = bedrock_agent_fixture.invoke("test prompt")
+
+        assert response.response == "test completion"
+        assert response.data == {
+            "bedrock_agent_trace": [
+                {"orchestrationTrace": "before"},
+                {"orchestrationTrace": "after"},
+            ]
+        }
+        assert mock_invoke_agent.call_args.kwargs["sessionState"] == {
+            "sessionAttributes": {"first_name": "user_name"},
+            "promptSessionAttributes": {"timezone": "0"},
+            "invocationId": "test-invocation-id",
+            "returnControlInvocationResults": [
+                {
+                    "functionResult": {
+                        "actionGroup": "WeatherAPIs",
+                        "function": "get_weather",
+                        "responseBody": {"TEXT": {"body": "mock response"}},
+                    }
+                }
+            ],
+        }
+        assert bedrock_agent_fixture._session_state == {
+            "sessionAttributes": {"first_name": "user_name"},
+            "promptSessionAttributes": {"timezone": "0"},
+        }
+
+    @pytest.mark.parametrize("io_bound", [False, True])
+    def test_get_mock_responses(self, mocker, bedrock_agent_fixture, io_bound):
+        mock_hook = mocker.MagicMock(io_bound=io_bound)
+        mock_hook.get_response_for_invocation.side_effect = lambda i: i["id"] * 2
+        bedrock_agent_fixture._return_control_hook = mock_hook
+        mock_executor = mocker.spy(target.concurrent.futures, "ThreadPoolExecutor")
+
+        mock_responses = bedrock_agent_fixture._get_mock_responses(
+            [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        )
+
+        assert mock_responses == ["aa", "bb", "cc"]
+        assert mock_executor.called is io_bound
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from agenteval.test import TestSuite
+from pydantic import ValidationError
+from agenteval.test import Test, TestSuite
 from agenteval.test.return_control import TestStep, ExpectedInvocation, ApiInvocationInput, FunctionInvocationInput, InvocationParameter
 
 
@@ -22,8 +23,8 @@ class TestReturnControl:
         test_suite = TestSuite.load(config, None)
         assert len(test_suite.tests) == 1
         assert len(test_suite.tests[0].steps) == 2
-        assert test_suite.tests[0].steps[0] == "Step 1"
-        assert test_suite.tests[0].steps[1] == "Step 2"
+        assert test_suite.tests[0].steps[0] == TestStep(step="Step 1")
+        assert test_suite.tests[0].steps[1] == TestStep(step="Step 2")
 
     def test_parse_complex_steps_with_api_invocation(self):
         """Test parsing steps with API invocation configuration."""
@@ -168,15 +169,25 @@ class TestReturnControl:
         assert len(test_suite.tests) == 1
         assert len(test_suite.tests[0].steps) == 3
 
-        # First step should be a string
-        assert test_suite.tests[0].steps[0] == "Simple step 1"
+        # First step should be a TestStep without an expected invocation
+        assert test_suite.tests[0].steps[0] == TestStep(step="Simple step 1")
 
         # Second step should be a TestStep
         assert isinstance(test_suite.tests[0].steps[1], TestStep)
         assert test_suite.tests[0].steps[1].step == "Complex step with invocation"
 
-        # Third step should be a string
-        assert test_suite.tests[0].steps[2] == "Simple step 2"
+        # Third step should be a TestStep without an expected invocation
+        assert test_suite.tests[0].steps[2] == TestStep(step="Simple step 2")
+
+        test = test_suite.tests[0]
+        assert test.step_texts == [
+            "Simple step 1",
+            "Complex step with invocation",
+            "Simple step 2",
+        ]
+        assert test.get_step_text(1) == "Complex step with invocation"
+        assert test.get_expected_invocation(0) is None
+        assert test.get_expected_invocation(1) is test.steps[1].expected_invocation
 
     def test_invalid_step_configuration(self):
         """Test that invalid step configuration raises an error."""
@@ -194,3 +205,101 @@ class TestReturnControl:
 
         with pytest.raises(ValueError, match="Step configuration must contain 'step' field"):
             TestSuite.load(config, None)
+
+    def test_expected_invocation_is_frozen(self):
+        """Test that expected invocations cannot be modified after loading."""
+        parameter = InvocationParameter(name="city", type="string", value="Toronto")
+        expected_invocation = ExpectedInvocation(
+            functionInvocationInput=FunctionInvocationInput(
+                actionGroup="WeatherAPIs",
+                function="get_weather",
+                parameters=[parameter],
+            ),
+            invocation_response_file="weather_toronto.json",
+        )
+
+        with pytest.raises(ValidationError):
+            expected_invocation.invocation_response_file = "other.json"
+        with pytest.raises(ValidationError):
+            parameter.value = "Ottawa"
+        assert hash(parameter) == hash(
+            InvocationParameter(name="city", type="string", value="Toronto")
+        )
+
+    def test_invalid_step_text(self):
+        """Test that a non-string step raises an error."""
+        config = {
+            "test1": {
+                "steps": [{"step": ["Step 1"]}],
+                "expected_results": ["Result 1"],
+                "max_turns": 5
+            }
+        }
+
+        with pytest.raises(ValueError, match="Step must be a string"):
+            TestSuite.load(config, None)
+
+    def test_invalid_expected_invocation(self):
+        """Test that an invalid expected invocation raises a validation error."""
+        config = {
+            "test1": {
+                "steps": [
+                    {
+                        "step": "Ask about the weather",
+                        "expected_invocation": {
+                            "functionInvocationInput": {
+                                "actionGroup": "WeatherAPIs",
+                                "function": "get_weather",
+                                "parameters": [{"name": "city", "value": "Toronto"}]
+                            },
+                            "invocation_response_file": "weather_toronto.json"
+                        }
+                    }
+                ],
+                "expected_results": ["Result 1"],
+                "max_turns": 5
+            }
+        }
+
+        with pytest.raises(ValidationError, match="type"):
+            TestSuite.load(config, None)
+
+    def test_test_converts_string_steps(self):
+        """Test that plain string steps are converted to TestStep objects."""
+        test = Test(
+            name="test1",
+            steps=["Step 1", TestStep(step="Step 2")],
+            expected_results=["Result 1"],
+            max_turns=5
+        )
+
+        assert test.steps == [TestStep(step="Step 1"), TestStep(step="Step 2")]
+        assert test.get_step_text(0) == "Step 1"
+        assert test.get_expected_invocation(0) is None
+
+    def test_unknown_invocation_field(self):
+        """Test that a misspelled invocation field raises a validation error."""
+        config = {
+            "test1": {
+                "steps": [
+                    {
+                        "step": "Ask about the weather",
+                        "expected_invocation": {
+                            "functionInvocationInput": {
+                                "actionGroup": "WeatherAPIs",
+                                "function": "get_weather",
+                                "paramters": [
+                                    {"name": "city", "type": "string", "value": "Toronto"}
+                                ]
+                            },
+                            "invocation_response_file": "weather_toronto.json"
+                        }
+                    }
+                ],
+                "expected_results": ["Result 1"],
+                "max_turns": 5
+            }
+        }
+
+        with pytest.raises(ValidationError, match="paramters"):
+            TestSuite.load(config, None)
@@ -22,6 +22,7 @@ class TestTestSuite:
     def test_load(self):
         suite = test_suite.TestSuite.load(test_config, None)
         assert suite.num_tests == 3
+        assert len(suite) == 3
         assert suite.tests[0].max_turns == test_suite.defaults.MAX_TURNS
         assert suite.tests[1].max_turns == 5
 
@@ -29,13 +30,28 @@ class TestTestSuite:
         suite = test_suite.TestSuite.load(test_config, filter="test_2,test_3")
         assert suite.num_tests == 2
 
+    def test_load_with_filter_preserves_config_order(self):
+        suite = test_suite.TestSuite.load(test_config, filter="test_3,test_1,test_3")
+        assert [test.name for test in suite.tests] == ["test_1", "test_3"]
+
+    def test_load_with_unknown_filter(self):
+        with pytest.raises(KeyError, match="Unknown tests in filter: test_4, test_5"):
+            test_suite.TestSuite.load(test_config, filter="test_4,test_2,test_5")
+
     @pytest.mark.parametrize(
         "input,expected",
         [
-            ("test_1", ["test_1"]),
-            ("test_1,test_2", ["test_1", "test_2"]),
-            ("test_1, test_2 ", ["test_1", "test_2"]),
+            ("test_1", {"test_1"}),
+            ("test_1,test_2", {"test_1", "test_2"}),
+            ("test_1, test_2 ", {"test_1", "test_2"}),
+            ("test_1,test_1", {"test_1"}),
         ],
     )
     def test_parse_filter_test_names(self, input, expected):
         assert expected == test_suite.TestSuite._parse_filter(input)
+
+    def test_duplicate_test_names(self):
+        tests = test_suite.TestSuite.load(test_config, None).tests
+
+        with pytest.raises(ValueError, match="found duplicate: test_2"):
+            test_suite.TestSuite(tests=[tests[0], tests[1], tests[1], tests[2]])
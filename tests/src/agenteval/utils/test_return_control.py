@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from agenteval.test.return_control import ExpectedInvocation, FunctionInvocationInput
+from agenteval.utils import return_control
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    return_control.load_response_file.cache_clear()
+
+
+@pytest.fixture
+def function_invocation_fixture():
+    return FunctionInvocationInput(
+        actionGroup="WeatherAPIs",
+        function="get_weather",
+        parameters=[
+            {"name": "city", "type": "string", "value": "Toronto"},
+            {"name": "country", "type": "string", "value": "CA"},
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "parameters,expected",
+    [
+        ([{"name": "city", "value": "Toronto"}, {"name": "country", "value": "CA"}], True),
+        ([{"name": "country", "value": "CA"}, {"name": "city", "value": "Toronto"}], True),
+        ([{"name": "city", "value": "Toronto"}], False),
+        ([{"name": "city", "value": "Ottawa"}, {"name": "country", "value": "CA"}], False),
+        ([{"name": "city", "value": "Toronto"}, {"name": "state", "value": "CA"}], False),
+        ([{"name": "city", "value": "Toronto"}, {"name": "city", "value": "Toronto"}], False),
+    ],
+)
+def test_match_function_invocation(function_invocation_fixture, parameters, expected):
+    actual = {
+        "actionGroup": "WeatherAPIs",
+        "function": "get_weather",
+        "parameters": parameters,
+    }
+
+    assert (
+        return_control.match_function_invocation(function_invocation_fixture, actual)
+        is expected
+    )
+
+
+def test_match_function_invocation_wrong_function(function_invocation_fixture):
+    actual = {"actionGroup": "WeatherAPIs", "function": "get_forecast"}
+
+    assert (
+        return_control.match_function_invocation(function_invocation_fixture, actual)
+        is False
+    )
+
+
+def test_load_response_file(tmp_path):
+    (tmp_path / "response.json").write_text('{"temperature": 22}')
+
+    assert (
+        return_control.load_response_file("response.json", str(tmp_path))
+        == '{"temperature": 22}'
+    )
+
+
+def test_load_response_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Response file not found"):
+        return_control.load_response_file("missing.json", str(tmp_path))
+
+
+def test_load_response_file_removed_after_stat(mocker, tmp_path):
+    response_file = tmp_path / "response.txt"
+    response_file.write_text("sunny")
+    mocker.patch.object(
+        return_control,
+        "_read_response_file",
+        side_effect=FileNotFoundError(2, "No such file or directory"),
+    )
+
+    with pytest.raises(FileNotFoundError, match="Response file not found"):
+        return_control.load_response_file(str(response_file))
+
+
+def test_load_response_file_cached(tmp_path):
+    response_file = tmp_path / "response.txt"
+    response_file.write_text("sunny")
+    cache_info = return_control._read_response_file.cache_info
+
+    return_control.load_response_file(str(response_file))
+    assert return_control.load_response_file(str(response_file)) == "sunny"
+    assert cache_info().misses == 1
+
+    response_file.write_text("rainy")
+    stat = response_file.stat()
+    os.utime(response_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert return_control.load_response_file(str(response_file)) == "rainy"
+    assert cache_info().misses == 2
+
+
+def test_match_trace_invocation(function_invocation_fixture):
+    expected = ExpectedInvocation(
+        functionInvocationInput=function_invocation_fixture,
+        invocation_response_file="weather_toronto.json",
+    )
+    trace = {
+        "actionGroupName": "WeatherAPIs",
+        "function": "get_weather",
+        "parameters": [
+            {"name": "city", "type": "string", "value": "Toronto"},
+            {"name": "country", "type": "string", "value": "CA"},
+        ],
+        "executionType": "RETURN_CONTROL",
+    }
+
+    assert return_control.match_trace_invocation(expected, trace) is True
+
+    trace["function"] = "get_forecast"
+    assert return_control.match_trace_invocation(expected, trace) is False